@@ -96,6 +96,22 @@ DOMAIN_CATEGORIES = {
     }
 }
 
+# Keywords per category, lowercased once for case-insensitive matching
+CATEGORY_KEYWORDS = {
+    cat: tuple(keyword.lower() for keyword in info["keywords"])
+    for cat, info in DOMAIN_CATEGORIES.items()
+}
+
+# Command-line options, printed when no or an unknown option is given
+USAGE = """
+Usage:
+  --report    Generate markdown report
+  --json      Output proposals as JSON (internal format)
+  --elspais   Output proposals for elspais edit --from-json
+  --apply     Apply changes via elspais edit
+  --dry-run   Preview changes without applying
+"""
+
 
 def get_requirements_via_cli() -> Dict[str, Dict]:
     """
@@ -160,9 +176,9 @@ def classify_requirement(req_id: str, req: Dict) -> Tuple[str, str, float]:
 
     # Check keywords in title and body
     text = (title + " " + body).lower()
-    for cat, info in DOMAIN_CATEGORIES.items():
-        for keyword in info["keywords"]:
-            if keyword.lower() in text:
+    for cat, keywords in CATEGORY_KEYWORDS.items():
+        for keyword in keywords:
+            if keyword in text:
                 scores[cat] += 1.0
 
     if not scores:
@@ -370,12 +386,7 @@ def main():
 
 
 def print_usage():
-    print("\nUsage:")
-    print("  --report    Generate markdown report")
-    print("  --json      Output proposals as JSON (internal format)")
-    print("  --elspais   Output proposals for elspais edit --from-json")
-    print("  --apply     Apply changes via elspais edit")
-    print("  --dry-run   Preview changes without applying")
+    sys.stdout.write(USAGE)
 
 
 if __name__ == "__main__":
@@ -625,34 +625,36 @@ def main() -> int:
     if start_req not in requirements:
         print(f"ERROR: {start_req} not found", file=sys.stderr)
         print(f"Available top-level REQs:", file=sys.stderr)
-        for req_id, node in requirements.items():
-            if not node.implements:
-                print(f"  {req_id}: {node.title}", file=sys.stderr)
+        sys.stderr.write(''.join(
+            f"  {req_id}: {node.title}\n"
+            for req_id, node in requirements.items()
+            if not node.implements
+        ))
         return 1
 
     # Count children
     start_node = requirements[start_req]
     child_count = len(start_node.children)
-    print(
-        f"Starting from {start_req} ({child_count} direct children)",
-        file=sys.stderr
-    )
+    # Run header is collected and written once; stderr is unbuffered, so
+    # each print() would be a separate write
+    header_lines = [f"Starting from {start_req} ({child_count} direct children)"]
 
     if args.depth is not None:
-        print(f"Depth limit: {args.depth}", file=sys.stderr)
+        header_lines.append(f"Depth limit: {args.depth}")
 
     # Display mode
     if args.line_breaks_only:
-        print("Mode: Line breaks only (no AI reformatting)", file=sys.stderr)
+        header_lines.append("Mode: Line breaks only (no AI reformatting)")
     elif args.fix_line_breaks:
-        print("Mode: Full reformat + line break fixing", file=sys.stderr)
+        header_lines.append("Mode: Full reformat + line break fixing")
     else:
-        print("Mode: Full AI-based reformatting", file=sys.stderr)
+        header_lines.append("Mode: Full AI-based reformatting")
 
     if args.parallel:
-        print(f"Parallel: {args.workers} workers", file=sys.stderr)
+        header_lines.append(f"Parallel: {args.workers} workers")
 
-    print("", file=sys.stderr)
+    header_lines.append("")
+    sys.stderr.write("\n".join(header_lines) + "\n")
 
     # Process - use parallel or sequential based on --parallel flag
     if args.parallel and not args.line_breaks_only:
@@ -681,12 +683,15 @@ def main() -> int:
         )
 
     # Summary
-    print("", file=sys.stderr)
-    print("--- Summary ---", file=sys.stderr)
-    print(f"Visited: {len(visited)}", file=sys.stderr)
-    print(f"Processed: {len(results['processed'])}", file=sys.stderr)
-    print(f"Already formatted: {len(results['already_formatted'])}", file=sys.stderr)
-    print(f"Errors: {len(results['errors'])}", file=sys.stderr)
+    summary_lines = [
+        "",
+        "--- Summary ---",
+        f"Visited: {len(visited)}",
+        f"Processed: {len(results['processed'])}",
+        f"Already formatted: {len(results['already_formatted'])}",
+        f"Errors: {len(results['errors'])}",
+    ]
+    sys.stderr.write("\n".join(summary_lines) + "\n")
 
     # Output JSON if requested
     if args.output_json:
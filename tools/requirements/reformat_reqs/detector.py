@@ -9,6 +9,25 @@ import re
 from dataclasses import dataclass
 
 
+# '## Assertions' section header
+ASSERTIONS_SECTION_PATTERN = re.compile(r'^##\s+Assertions\s*$', re.MULTILINE)
+
+# Labeled assertions (A., B., C., etc. followed by SHALL somewhere in the line)
+LABELED_ASSERTION_PATTERN = re.compile(
+    r'^[A-Z]\.\s+.*\bSHALL\b',
+    re.MULTILINE | re.IGNORECASE
+)
+
+# '**Acceptance Criteria**:' / 'Acceptance Criteria:' section, or SHALL
+# anywhere. One alternation finds both in a single scan; the two can never
+# overlap, so neither hides a match of the other.
+ACCEPTANCE_OR_SHALL_PATTERN = re.compile(
+    r'(?P<acceptance>\*?\*?Acceptance\s+Criteria\*?\*?\s*:)'
+    r'|(?P<shall>\bSHALL\b)',
+    re.IGNORECASE
+)
+
+
 @dataclass
 class FormatAnalysis:
     """Result of format detection analysis."""
@@ -42,32 +61,30 @@ def detect_format(body: str, rationale: str = "") -> FormatAnalysis:
     Returns:
         FormatAnalysis with detection results
     """
-    full_text = f"{body}\n{rationale}".strip()
+    # rationale is always a str; only join when there is one to append
+    full_text = f"{body}\n{rationale}".strip() if rationale else body.strip()
 
-    # Check for ## Assertions section
-    has_assertions_section = bool(
-        re.search(r'^##\s+Assertions\s*$', full_text, re.MULTILINE)
+    # Check for ## Assertions section (skip the regex when there is no heading)
+    has_assertions_section = (
+        '##' in full_text and bool(ASSERTIONS_SECTION_PATTERN.search(full_text))
     )
 
     # Check for labeled assertions (A., B., C., etc. followed by SHALL somewhere in the line)
-    labeled_assertions = re.findall(
-        r'^[A-Z]\.\s+.*\bSHALL\b',
-        full_text,
-        re.MULTILINE | re.IGNORECASE
-    )
+    labeled_assertions = LABELED_ASSERTION_PATTERN.findall(full_text)
     has_labeled_assertions = len(labeled_assertions) >= 1
     assertion_count = len(labeled_assertions)
 
-    # Check for Acceptance Criteria section
-    has_acceptance_criteria = bool(re.search(
-        r'\*?\*?Acceptance\s+Criteria\*?\*?\s*:',
-        full_text,
-        re.IGNORECASE
-    ))
-
-    # Check for SHALL language usage anywhere
-    shall_count = len(re.findall(r'\bSHALL\b', full_text, re.IGNORECASE))
-    uses_shall_language = shall_count >= 1
+    # Check for Acceptance Criteria section and SHALL language usage anywhere,
+    # stopping as soon as both have been seen
+    has_acceptance_criteria = False
+    uses_shall_language = False
+    for match in ACCEPTANCE_OR_SHALL_PATTERN.finditer(full_text):
+        if match.lastgroup == 'acceptance':
+            has_acceptance_criteria = True
+        else:
+            uses_shall_language = True
+        if has_acceptance_criteria and uses_shall_language:
+            break
 
     # Determine if new format
     # New format: has Assertions section with labeled assertions, no Acceptance Criteria
@@ -46,39 +46,69 @@ def find_requirement_in_file(file_path: str, req_id: str) -> Tuple[int, int, str
         ValueError: If requirement boundaries not found
     """
     with open(file_path, 'r') as f:
-        lines = f.readlines()
+        text = f.read()
 
-    start_line = None
-    end_line = None
+    start_offset, end_offset = _locate_requirement(text, file_path, req_id)
 
+    start_line = text.count('\n', 0, start_offset)
+    # end_offset is just past the end marker line (or at end of file)
+    end_line = start_line + text.count('\n', start_offset, end_offset - 1)
+
+    # Include the end marker line in the content
+    content = text[start_offset:end_offset]
+    return start_line, end_line, content
+
+
+def _locate_requirement(text: str, file_path: str, req_id: str) -> Tuple[int, int]:
+    """
+    Find the character span of a requirement in a file's text.
+
+    Both patterns scan the whole text in MULTILINE mode rather than being
+    matched line by line, so no line list is built.
+
+    Args:
+        text: Content of the spec file
+        file_path: Path to spec file (for error messages)
+        req_id: Requirement ID (e.g., 'REQ-p00046')
+
+    Returns:
+        Tuple of (start_offset, end_offset): from the start of the header
+        line to just past the end marker line's newline
+
+    Raises:
+        ValueError: If requirement boundaries not found
+    """
     # Pattern for requirement header: # REQ-xxx: Title or ## REQ-xxx: Title
-    # Need to escape the req_id properly for regex
+    # Need to escape the req_id properly for regex; [^\S\n] keeps the
+    # hashes and the ID on the same line
     header_pattern = re.compile(
-        rf'^#+\s+{re.escape(req_id)}:\s+',
-        re.IGNORECASE
+        rf'^#+[^\S\n]+{re.escape(req_id)}:\s+',
+        re.IGNORECASE | re.MULTILINE
     )
 
     # Pattern for end marker: *End* *Title* | **Hash**: value
+    # (may be indented; [^\S\n] keeps each match on a single line)
     end_pattern = re.compile(
-        r'^\*End\*\s+\*[^*]+\*\s+\|\s+\*\*Hash\*\*:',
-        re.IGNORECASE
+        r'^[^\S\n]*\*End\*[^\S\n]+\*[^*\n]+\*[^\S\n]+\|[^\S\n]+\*\*Hash\*\*:',
+        re.IGNORECASE | re.MULTILINE
     )
 
-    for i, line in enumerate(lines):
-        if start_line is None and header_pattern.match(line):
-            start_line = i
-        elif start_line is not None and end_pattern.match(line.strip()):
-            end_line = i
-            break
-
-    if start_line is None:
+    header_match = header_pattern.search(text)
+    if header_match is None:
         raise ValueError(f"Could not find header for {req_id} in {file_path}")
-    if end_line is None:
+
+    # The end marker is searched for from the line after the header
+    header_line_end = text.find('\n', header_match.start())
+    end_match = None
+    if header_line_end != -1:
+        end_match = end_pattern.search(text, header_line_end + 1)
+    if end_match is None:
         raise ValueError(f"Could not find end marker for {req_id} in {file_path}")
 
-    # Include the end marker line in the content
-    content = ''.join(lines[start_line:end_line + 1])
-    return start_line, end_line, content
+    end_offset = text.find('\n', end_match.start())
+    end_offset = len(text) if end_offset == -1 else end_offset + 1
+
+    return header_match.start(), end_offset
 
 
 def replace_requirement_in_file(
@@ -106,21 +136,19 @@ def replace_requirement_in_file(
     if create_backup:
         backup_file(file_path)
 
-    start_line, end_line, _ = find_requirement_in_file(file_path, req_id)
-
+    # Read once; the requirement is located in the same text it replaces
     with open(file_path, 'r') as f:
-        lines = f.readlines()
+        text = f.read()
+
+    start_offset, end_offset = _locate_requirement(text, file_path, req_id)
 
     # Ensure new content ends with newline
     if not new_content.endswith('\n'):
         new_content += '\n'
 
-    # Replace lines: before + new content + after
-    # Note: end_line is inclusive, so we skip to end_line + 1
-    new_lines = lines[:start_line] + [new_content] + lines[end_line + 1:]
-
+    # Replace: before + new content + after (end marker line included)
     with open(file_path, 'w') as f:
-        f.writelines(new_lines)
+        f.write(text[:start_offset] + new_content + text[end_offset:])
 
     return True
 
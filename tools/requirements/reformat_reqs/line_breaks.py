@@ -14,6 +14,19 @@ import re
 from typing import List, Tuple
 
 
+# Lettered assertions (A. B. C. etc)
+LETTERED_ITEM_PATTERN = re.compile(r'[A-Z]\.\s')
+
+# Numbered lists (1. 2. 3. etc)
+NUMBERED_ITEM_PATTERN = re.compile(r'\d+\.\s')
+
+# Runs of whitespace collapsed when reflowing a paragraph
+WHITESPACE_RUN_PATTERN = re.compile(r'\s+')
+
+# Three or more newlines (two or more blank lines)
+BLANK_LINES_PATTERN = re.compile(r'\n{3,}')
+
+
 def normalize_line_breaks(content: str, reflow: bool = True) -> str:
     """
     Normalize line breaks in requirement content.
@@ -33,7 +46,7 @@ def normalize_line_breaks(content: str, reflow: bool = True) -> str:
         line = lines[i]
 
         # Check if this is a section header (## Something)
-        if re.match(r'^##\s+\w', line):
+        if _is_section_header(line):
             result_lines.append(line)
             # Skip blank lines immediately after section header
             i += 1
@@ -53,7 +66,7 @@ def normalize_line_breaks(content: str, reflow: bool = True) -> str:
                 # Stop at blank lines, structural elements, or next section
                 if (next_line.strip() == '' or
                     _is_structural_line(next_line) or
-                    re.match(r'^##\s+', next_line)):
+                    _is_section_header(next_line, require_title=False)):
                     break
                 para_lines.append(next_line.rstrip())
                 i += 1
@@ -71,6 +84,22 @@ def normalize_line_breaks(content: str, reflow: bool = True) -> str:
     return _collapse_blank_lines('\n'.join(result_lines))
 
 
+def _is_section_header(line: str, require_title: bool = True) -> bool:
+    """
+    Check if a line is a section header (## Something).
+
+    Equivalent to re.match(r'^##\\s+\\w', line), or r'^##\\s+' when
+    require_title is False. Most lines fail the prefix check, so the
+    regex engine is never needed.
+    """
+    if not line.startswith('##') or len(line) < 3 or not line[2].isspace():
+        return False
+    if not require_title:
+        return True
+    title = line[3:].lstrip()
+    return bool(title) and (title[0].isalnum() or title[0] == '_')
+
+
 def _is_structural_line(line: str) -> bool:
     """
     Check if a line is structural (should not be reflowed).
@@ -92,23 +121,19 @@ def _is_structural_line(line: str) -> bool:
         return True
 
     # Lettered assertions (A. B. C. etc)
-    if re.match(r'^[A-Z]\.\s', stripped):
+    if LETTERED_ITEM_PATTERN.match(stripped):
         return True
 
     # Numbered lists (1. 2. 3. etc)
-    if re.match(r'^\d+\.\s', stripped):
+    if NUMBERED_ITEM_PATTERN.match(stripped):
         return True
 
     # Bullet points
     if stripped.startswith(('- ', '* ', '+ ')):
         return True
 
-    # Metadata line
-    if stripped.startswith('**Level**:') or stripped.startswith('**Status**:'):
-        return True
-
-    # Combined metadata line
-    if re.match(r'\*\*Level\*\*:', stripped):
+    # Metadata line (including the combined Level | Status | Implements line)
+    if stripped.startswith(('**Level**:', '**Status**:')):
         return True
 
     # End marker
@@ -141,7 +166,7 @@ def _reflow_paragraph(lines: List[str]) -> str:
     # Join lines with space, collapsing multiple spaces
     joined = ' '.join(line.strip() for line in lines if line.strip())
     # Collapse multiple spaces
-    return re.sub(r'\s+', ' ', joined)
+    return WHITESPACE_RUN_PATTERN.sub(' ', joined)
 
 
 def _collapse_blank_lines(content: str) -> str:
@@ -155,7 +180,7 @@ def _collapse_blank_lines(content: str) -> str:
         Content with at most one blank line between paragraphs
     """
     # Replace 3+ newlines with 2 newlines (one blank line)
-    return re.sub(r'\n{3,}', '\n\n', content)
+    return BLANK_LINES_PATTERN.sub('\n\n', content)
 
 
 def fix_requirement_line_breaks(
@@ -189,9 +214,12 @@ def detect_line_break_issues(content: str) -> List[str]:
     issues = []
     lines = content.split('\n')
 
+    # Most bodies have no section headers; skip the per-line header check
+    has_headers = '##' in content
+
     for i, line in enumerate(lines):
         # Check for blank line after section header
-        if re.match(r'^##\s+\w', line):
+        if has_headers and _is_section_header(line):
             # Look ahead for multiple blank lines
             blank_count = 0
             j = i + 1
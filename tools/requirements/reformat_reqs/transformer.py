@@ -241,9 +241,11 @@ def validate_reformatted_content(
         return False, warnings
 
     # Check each assertion uses SHALL
+    missing_shall = False
     for i, assertion in enumerate(assertions):
         label = chr(ord('A') + i)
         if 'SHALL' not in assertion.upper():
+            missing_shall = True
             warnings.append(f"Assertion {label} missing SHALL keyword")
 
     # Check rationale doesn't use SHALL
@@ -259,5 +261,5 @@ def validate_reformatted_content(
     if len(assertions) < 2 and len(original.body) > 500:
         warnings.append("Few assertions from large body - may have missed obligations")
 
-    is_valid = not any("missing SHALL" in w or "No assertions" in w for w in warnings)
-    return is_valid, warnings
+    # "No assertions" returned early above, so only missing SHALL invalidates
+    return not missing_shall, warnings
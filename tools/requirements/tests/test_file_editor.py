@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test suite for reformat_reqs.file_editor requirement location
+
+Tests:
+1. Requirement boundaries (header line to end marker line)
+2. Header matching stays on a single line
+
+Usage:
+    python3 -m unittest tools/requirements/tests/test_file_editor.py
+"""
+
+import sys
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add tools/requirements to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from reformat_reqs.file_editor import find_requirement_in_file, replace_requirement_in_file
+
+
+class TestFindRequirementInFile(unittest.TestCase):
+    """Test locating a requirement block in a spec file"""
+
+    def setUp(self):
+        """Create temporary directory for spec files"""
+        self.test_dir = tempfile.mkdtemp()
+        self.spec_file = Path(self.test_dir) / "prd-test.md"
+
+    def tearDown(self):
+        """Clean up temporary directory"""
+        shutil.rmtree(self.test_dir)
+
+    def test_finds_header_to_end_marker(self):
+        """Test that start and end lines span the header and end marker"""
+        self.spec_file.write_text(
+            "# Spec\n"
+            "\n"
+            "# REQ-p00046: Title\n"
+            "body\n"
+            "*End* *Title* | **Hash**: abc\n"
+            "after\n"
+        )
+
+        start, end, content = find_requirement_in_file(str(self.spec_file), 'REQ-p00046')
+
+        self.assertEqual((start, end), (2, 4))
+        self.assertTrue(content.startswith("# REQ-p00046: Title\n"))
+        self.assertTrue(content.endswith("*End* *Title* | **Hash**: abc\n"))
+
+    def test_lone_hash_line_is_not_a_header(self):
+        """Test that a '#' line followed by the ID line is not matched as a header"""
+        self.spec_file.write_text(
+            "#\n"
+            "REQ-p00046: Title\n"
+            "body\n"
+            "*End* *Title* | **Hash**: abc\n"
+        )
+
+        with self.assertRaises(ValueError):
+            find_requirement_in_file(str(self.spec_file), 'REQ-p00046')
+
+        with self.assertRaises(ValueError):
+            replace_requirement_in_file(str(self.spec_file), 'REQ-p00046', "new\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
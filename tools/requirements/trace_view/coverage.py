@@ -5,10 +5,48 @@ Provides functions to calculate implementation coverage and status
 for requirements.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from .models import Requirement
 
+# Implementation statuses that count a requirement as traced
+IMPLEMENTED_STATUSES = frozenset({'Full', 'Partial'})
+
+
+def build_children_index(requirements: Dict[str, Requirement]) -> Dict[str, List[Requirement]]:
+    """Map each requirement ID to the requirements that implement it.
+
+    Building the index once replaces a scan of every requirement each time
+    the children of one requirement are needed.
+
+    Args:
+        requirements: Dict mapping requirement ID to Requirement
+
+    Returns:
+        Dict mapping parent requirement ID to its children, in the
+        iteration order of requirements
+    """
+    children_index: Dict[str, List[Requirement]] = {}
+    for req in requirements.values():
+        # A parent listed twice still has this requirement as one child
+        for parent_id in dict.fromkeys(req.implements):
+            children_index.setdefault(parent_id, []).append(req)
+    return children_index
+
+
+def _get_children(
+    requirements: Dict[str, Requirement],
+    req_id: str,
+    children_index: Optional[Dict[str, List[Requirement]]]
+) -> List[Requirement]:
+    """Get the requirements implementing req_id, using the index if given."""
+    if children_index is not None:
+        return children_index.get(req_id, [])
+    return [
+        r for r in requirements.values()
+        if req_id in r.implements
+    ]
+
 
 def count_by_level(requirements: Dict[str, Requirement]) -> Dict[str, Dict[str, int]]:
     """Count requirements by level, both including and excluding Deprecated.
@@ -40,46 +78,49 @@ def find_orphaned_requirements(requirements: Dict[str, Requirement]) -> List[Req
     Returns:
         List of orphaned requirements (non-PRD requirements with no implements)
     """
-    implemented = set()
-    for req in requirements.values():
-        implemented.update(req.implements)
+    implemented = set().union(*(req.implements for req in requirements.values()))
 
-    orphaned = []
-    for req in requirements.values():
-        # Skip PRD requirements (they're top-level)
-        if req.level == 'PRD':
-            continue
-        # Skip if this requirement is implemented by someone
-        if req.id in implemented:
-            continue
-        # Skip if it has no parent (should have one)
-        if not req.implements:
-            orphaned.append(req)
+    # Non-PRD requirements (PRD is top-level) that have no parent, though
+    # they should have one
+    parentless = {
+        req.id: req for req in requirements.values()
+        if req.level != 'PRD' and not req.implements
+    }
 
-    return sorted(orphaned, key=lambda r: r.id)
+    # Orphaned unless some other requirement implements them
+    orphan_ids = parentless.keys() - implemented
 
+    return sorted((parentless[req_id] for req_id in orphan_ids), key=lambda r: r.id)
 
-def calculate_coverage(requirements: Dict[str, Requirement], req_id: str) -> dict:
+
+def calculate_coverage(
+    requirements: Dict[str, Requirement],
+    req_id: str,
+    children_index: Optional[Dict[str, List[Requirement]]] = None,
+    status_cache: Optional[Dict[str, str]] = None
+) -> dict:
     """Calculate coverage for a requirement.
 
     Args:
         requirements: Dict mapping requirement ID to Requirement
         req_id: ID of requirement to calculate coverage for
+        children_index: Optional result of build_children_index(requirements)
+        status_cache: Optional dict of already computed implementation
+                      statuses, shared across calls for one report
 
     Returns:
         Dict with 'children' (total child count) and 'traced' (children with implementation)
     """
     # Find all requirements that implement this requirement (children)
-    children = [
-        r for r in requirements.values()
-        if req_id in r.implements
-    ]
+    children = _get_children(requirements, req_id, children_index)
 
     # Count how many children have implementation files or their own children with implementation
     traced = 0
     for child in children:
-        child_status = get_implementation_status(requirements, child.id)
-        if child_status in ['Full', 'Partial']:
+        child_status = get_implementation_status(
+            requirements, child.id, children_index, status_cache
+        )
+        if child_status in IMPLEMENTED_STATUSES:
             traced += 1
 
     return {
@@ -88,18 +129,49 @@ def calculate_coverage(requirements: Dict[str, Requirement], req_id: str) -> dic
     }
 
 
-def get_implementation_status(requirements: Dict[str, Requirement], req_id: str) -> str:
+def get_implementation_status(
+    requirements: Dict[str, Requirement],
+    req_id: str,
+    children_index: Optional[Dict[str, List[Requirement]]] = None,
+    status_cache: Optional[Dict[str, str]] = None
+) -> str:
     """Get implementation status for a requirement.
 
+    A requirement's status depends on its whole subtree, so without a cache
+    each subtree is re-evaluated for every ancestor that asks. Pass the same
+    status_cache to every call while building one report so each status is
+    computed once; it must not outlive changes to requirements.
+
     Args:
         requirements: Dict mapping requirement ID to Requirement
         req_id: ID of requirement to check
+        children_index: Optional result of build_children_index(requirements)
+        status_cache: Optional dict of already computed statuses; filled in
+                      as statuses are computed
 
     Returns:
         'Unimplemented': No children AND no implementation_files
         'Partial': Some but not all children traced
         'Full': Has implementation_files OR all children traced
     """
+    if status_cache is not None:
+        status = status_cache.get(req_id)
+        if status is None:
+            status = _compute_implementation_status(
+                requirements, req_id, children_index, status_cache
+            )
+            status_cache[req_id] = status
+        return status
+    return _compute_implementation_status(requirements, req_id, children_index, None)
+
+
+def _compute_implementation_status(
+    requirements: Dict[str, Requirement],
+    req_id: str,
+    children_index: Optional[Dict[str, List[Requirement]]],
+    status_cache: Optional[Dict[str, str]]
+) -> str:
+    """Compute implementation status; see get_implementation_status."""
     req = requirements.get(req_id)
     if not req:
         return 'Unimplemented'
@@ -108,18 +180,16 @@ def get_implementation_status(requirements: Dict[str, Requirement], req_id: str)
     if req.implementation_files:
         return 'Full'
 
-    # Find children
-    children = [
-        r for r in requirements.values()
-        if req_id in r.implements
-    ]
+    # Without an index, build one so children are found once, not twice
+    if children_index is None:
+        children_index = build_children_index(requirements)
 
     # No children and no implementation files = Unimplemented
-    if not children:
+    if not children_index.get(req_id):
         return 'Unimplemented'
 
     # Check how many children are traced
-    coverage = calculate_coverage(requirements, req_id)
+    coverage = calculate_coverage(requirements, req_id, children_index, status_cache)
 
     if coverage['traced'] == 0:
         return 'Unimplemented'
@@ -147,23 +217,30 @@ def generate_coverage_report(
         - Breakdown by implementation status (Full/Partial/Unimplemented)
     """
     if get_status_fn is None:
-        get_status_fn = lambda req_id: get_implementation_status(requirements, req_id)
+        children_index = build_children_index(requirements)
+        status_cache: Dict[str, str] = {}
+        get_status_fn = lambda req_id: get_implementation_status(
+            requirements, req_id, children_index, status_cache
+        )
 
     lines = []
     lines.append("=== Coverage Report ===")
     lines.append(f"Total Requirements: {len(requirements)}")
     lines.append("")
 
-    # Count by level
+    # Count by level and by implementation status in one pass, so each
+    # requirement's status is computed only once
     by_level = {'PRD': 0, 'OPS': 0, 'DEV': 0}
     implemented_by_level = {'PRD': 0, 'OPS': 0, 'DEV': 0}
+    status_counts = {'Full': 0, 'Partial': 0, 'Unimplemented': 0}
 
     for req in requirements.values():
         level = req.level
         by_level[level] = by_level.get(level, 0) + 1
 
         impl_status = get_status_fn(req.id)
-        if impl_status in ['Full', 'Partial']:
+        status_counts[impl_status] = status_counts.get(impl_status, 0) + 1
+        if impl_status in IMPLEMENTED_STATUSES:
             implemented_by_level[level] = implemented_by_level.get(level, 0) + 1
 
     lines.append("By Level:")
@@ -175,12 +252,6 @@ def generate_coverage_report(
 
     lines.append("")
 
-    # Count by implementation status
-    status_counts = {'Full': 0, 'Partial': 0, 'Unimplemented': 0}
-    for req in requirements.values():
-        impl_status = get_status_fn(req.id)
-        status_counts[impl_status] = status_counts.get(impl_status, 0) + 1
-
     lines.append("By Status:")
     lines.append(f"  Full: {status_counts['Full']}")
     lines.append(f"  Partial: {status_counts['Partial']}")
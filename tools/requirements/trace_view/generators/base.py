@@ -20,7 +20,12 @@ from ..git_state import (
     set_git_modified_files,
 )
 from ..scanning import scan_implementation_files
-from ..coverage import calculate_coverage, generate_coverage_report, get_implementation_status
+from ..coverage import (
+    build_children_index,
+    calculate_coverage,
+    generate_coverage_report,
+    get_implementation_status,
+)
 from .csv import generate_csv, generate_planning_csv
 from .markdown import generate_markdown
 
@@ -42,13 +47,6 @@ class TraceViewGenerator:
     # Version number - increment with each change
     VERSION = 16
 
-    # Map parsed levels to uppercase for consistency
-    LEVEL_MAP = {
-        'PRD': 'PRD',
-        'Ops': 'OPS',
-        'Dev': 'DEV'
-    }
-
     def __init__(
         self,
         spec_dir: Path,
@@ -233,8 +231,14 @@ class TraceViewGenerator:
     def _generate_planning_csv(self) -> str:
         """Generate planning CSV with actionable requirements."""
         # Create callback functions that close over self.requirements
-        get_status = lambda req_id: get_implementation_status(self.requirements, req_id)
-        calc_coverage = lambda req_id: calculate_coverage(self.requirements, req_id)
+        children_index = build_children_index(self.requirements)
+        status_cache: Dict[str, str] = {}
+        get_status = lambda req_id: get_implementation_status(
+            self.requirements, req_id, children_index, status_cache
+        )
+        calc_coverage = lambda req_id: calculate_coverage(
+            self.requirements, req_id, children_index, status_cache
+        )
         return generate_planning_csv(self.requirements, get_status, calc_coverage)
 
     def _scan_implementation_files(self):
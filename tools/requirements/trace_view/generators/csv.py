@@ -9,6 +9,10 @@ from io import StringIO
 from typing import Dict, Callable, List
 
 from ..models import Requirement
+from ..coverage import build_children_index
+
+# Statuses included in the planning CSV
+ACTIONABLE_STATUSES = frozenset({'Active', 'Draft'})
 
 
 def generate_csv(requirements: Dict[str, Requirement]) -> str:
@@ -39,13 +43,11 @@ def generate_csv(requirements: Dict[str, Requirement]) -> str:
 
     # Sort requirements by ID
     sorted_reqs = sorted(requirements.values(), key=lambda r: r.id)
+    children_index = build_children_index(requirements)
 
     for req in sorted_reqs:
-        # Compute children (traced by) dynamically
-        children = [
-            r.id for r in requirements.values()
-            if req.id in r.implements
-        ]
+        # Children (traced by) from the parent -> children index
+        children = [r.id for r in children_index.get(req.id, [])]
 
         # Format implementation files as "file:line" strings
         impl_files_str = ', '.join(
@@ -59,7 +61,7 @@ def generate_csv(requirements: Dict[str, Requirement]) -> str:
             req.status,
             ', '.join(req.implements) if req.implements else '-',
             ', '.join(sorted(children)) if children else '-',
-            req.file_path.name,
+            req.file_name,
             req.line_number,
             impl_files_str
         ])
@@ -100,7 +102,7 @@ def generate_planning_csv(
     # Filter to actionable requirements (Active or Draft status)
     actionable_reqs = [
         req for req in requirements.values()
-        if req.status in ['Active', 'Draft']
+        if req.status in ACTIONABLE_STATUSES
     ]
 
     # Sort by ID
@@ -9,7 +9,20 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 from ..models import Requirement
-from ..coverage import count_by_level, find_orphaned_requirements
+from ..coverage import build_children_index, count_by_level, find_orphaned_requirements
+
+# Emoji shown before each requirement in the tree, by status
+STATUS_EMOJI = {
+    'Active': '✅',
+    'Draft': '🚧',
+    'Deprecated': '⚠️'
+}
+
+# Safety limit on tree nesting when formatting the traceability tree
+MAX_TREE_DEPTH = 50
+
+# Indent strings for every level the tree can reach, built once
+TREE_INDENTS = tuple("  " * level for level in range(MAX_TREE_DEPTH + 2))
 
 
 def generate_legend_markdown() -> str:
@@ -69,10 +82,12 @@ def generate_markdown(
     # Start with top-level PRD requirements
     prd_reqs = [req for req in requirements.values() if req.level == 'PRD']
     prd_reqs.sort(key=lambda r: r.id)
+    children_index = build_children_index(requirements)
 
     for prd_req in prd_reqs:
         lines.append(format_req_tree_md(
-            prd_req, requirements, indent=0, ancestor_path=[], base_path=base_path
+            prd_req, requirements, indent=0, ancestor_path=[], base_path=base_path,
+            children_index=children_index
         ))
 
     # Orphaned ops/dev requirements
@@ -81,7 +96,7 @@ def generate_markdown(
         lines.append("\n## Orphaned Requirements\n")
         lines.append("*(Requirements not linked from any parent)*\n")
         for req in orphaned:
-            lines.append(f"- **REQ-{req.id}**: {req.title} ({req.level}) - {req.file_path.name}")
+            lines.append(f"- **REQ-{req.id}**: {req.title} ({req.level}) - {req.file_name}")
 
     return '\n'.join(lines)
 
@@ -91,7 +106,8 @@ def format_req_tree_md(
     requirements: Dict[str, Requirement],
     indent: int,
     ancestor_path: Optional[List[str]] = None,
-    base_path: str = ''
+    base_path: str = '',
+    children_index: Optional[Dict[str, List[Requirement]]] = None
 ) -> str:
     """Format requirement and its children as markdown tree.
 
@@ -101,67 +117,67 @@ def format_req_tree_md(
         indent: Current indentation level
         ancestor_path: List of requirement IDs in the current traversal path (for cycle detection)
         base_path: Base path for links
+        children_index: Optional result of build_children_index(requirements)
 
     Returns:
         Formatted markdown string
     """
-    if ancestor_path is None:
-        ancestor_path = []
-
-    # Cycle detection: check if this requirement is already in our traversal path
-    if req.id in ancestor_path:
-        cycle_path = ancestor_path + [req.id]
-        cycle_str = " -> ".join([f"REQ-{rid}" for rid in cycle_path])
-        print(f"⚠️  CYCLE DETECTED: {cycle_str}", file=sys.stderr)
-        return "  " * indent + f"- ⚠️ **CYCLE DETECTED**: REQ-{req.id} (path: {cycle_str})"
-
-    # Safety depth limit
-    MAX_DEPTH = 50
-    if indent > MAX_DEPTH:
-        print(f"⚠️  MAX DEPTH ({MAX_DEPTH}) exceeded at REQ-{req.id}", file=sys.stderr)
-        return "  " * indent + f"- ⚠️ **MAX DEPTH EXCEEDED**: REQ-{req.id}"
+    if children_index is None:
+        children_index = build_children_index(requirements)
 
     lines = []
-    prefix = "  " * indent
-
-    # Format current requirement
-    status_emoji = {
-        'Active': '✅',
-        'Draft': '🚧',
-        'Deprecated': '⚠️'
-    }
-    emoji = status_emoji.get(req.status, '❓')
-
-    # Create link to source file with REQ anchor
-    req_link = f"[REQ-{req.id}]({base_path}spec/{req.file_path.name}#REQ-{req.id})"
-
-    lines.append(
-        f"{prefix}- {emoji} **{req_link}**: {req.title}\n"
-        f"{prefix}  - Level: {req.level} | Status: {req.status}\n"
-        f"{prefix}  - File: {req.file_path.name}:{req.line_number}"
-    )
-
-    # Format implementation files as nested list with clickable links
-    if req.implementation_files:
-        lines.append(f"{prefix}  - **Implemented in**:")
-        for file_path, line_num in req.implementation_files:
-            # Create markdown link to file with line number anchor
-            link = f"[{file_path}:{line_num}]({base_path}{file_path}#L{line_num})"
-            lines.append(f"{prefix}    - {link}")
-
-    # Find and format children
-    children = [
-        r for r in requirements.values()
-        if req.id in r.implements
-    ]
-    children.sort(key=lambda r: r.id)
-
-    if children:
-        # Add current req to path before recursing into children
-        current_path = ancestor_path + [req.id]
-        for child in children:
-            lines.append(format_req_tree_md(
-                child, requirements, indent + 1, current_path, base_path
-            ))
+
+    # Walk the tree with an explicit stack instead of recursing per child.
+    # Each entry carries the ancestor IDs above it for cycle detection;
+    # children are pushed in reverse so they pop in sorted order, giving
+    # the same pre-order output as a recursive walk.
+    stack = [(req, indent, tuple(ancestor_path or ()))]
+
+    while stack:
+        req, indent, ancestors = stack.pop()
+        prefix = TREE_INDENTS[indent] if indent < len(TREE_INDENTS) else "  " * indent
+
+        # Cycle detection: check if this requirement is already in our traversal path
+        if req.id in ancestors:
+            cycle_str = " -> ".join([f"REQ-{rid}" for rid in ancestors + (req.id,)])
+            print(f"⚠️  CYCLE DETECTED: {cycle_str}", file=sys.stderr)
+            lines.append(f"{prefix}- ⚠️ **CYCLE DETECTED**: REQ-{req.id} (path: {cycle_str})")
+            continue
+
+        # Safety depth limit
+        if indent > MAX_TREE_DEPTH:
+            print(f"⚠️  MAX DEPTH ({MAX_TREE_DEPTH}) exceeded at REQ-{req.id}", file=sys.stderr)
+            lines.append(f"{prefix}- ⚠️ **MAX DEPTH EXCEEDED**: REQ-{req.id}")
+            continue
+
+        # Format current requirement
+        emoji = STATUS_EMOJI.get(req.status, '❓')
+
+        # Create link to source file with REQ anchor
+        req_link = f"[REQ-{req.id}]({base_path}spec/{req.file_name}#REQ-{req.id})"
+
+        lines.append(
+            f"{prefix}- {emoji} **{req_link}**: {req.title}\n"
+            f"{prefix}  - Level: {req.level} | Status: {req.status}\n"
+            f"{prefix}  - File: {req.file_name}:{req.line_number}"
+        )
+
+        # Format implementation files as nested list with clickable links
+        if req.implementation_files:
+            lines.append(f"{prefix}  - **Implemented in**:")
+            # One list item per file, linking to the line anchor; the item
+            # prefix is built once per requirement rather than per file
+            item_prefix = f"{prefix}    - ["
+            lines.extend(
+                f"{item_prefix}{file_path}:{line_num}]({base_path}{file_path}#L{line_num})"
+                for file_path, line_num in req.implementation_files
+            )
+
+        # Queue children, adding current req to their ancestor path
+        children = sorted(children_index.get(req.id, []), key=lambda r: r.id)
+        if children:
+            child_ancestors = ancestors + (req.id,)
+            for child in reversed(children):
+                stack.append((child, indent + 1, child_ancestors))
 
     return '\n'.join(lines)
@@ -8,8 +8,21 @@ to manage git state shared across the application.
 import re
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Set, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
+
+# REQ headers in spec files; group 1 is the ID without sponsor prefix
+SPEC_REQ_HEADER_PATTERN = re.compile(
+    r'^#{1,6}\s+REQ-(?:[A-Z]{2,4}-)?([pod]\d{5}):', re.MULTILINE
+)
+
+# One 'git status --porcelain' entry: two-letter XY status, a separator,
+# then the path ("orig -> renamed" for renames)
+PORCELAIN_ENTRY_PATTERN = re.compile(r'^(..).(.*)$', re.MULTILINE)
+
+# Concurrent 'git show' processes when reading committed spec files
+GIT_SHOW_MAX_WORKERS = 8
 
 
 def get_requirements_via_cli() -> Dict[str, Dict]:
@@ -92,21 +105,22 @@ def get_git_modified_files(repo_root: Path) -> Tuple[Set[str], Set[str]]:
         modified_files: Set[str] = set()
         untracked_files: Set[str] = set()
         # Don't strip stdout - it would remove leading space from first line's " M" prefix
-        for line in result.stdout.split('\n'):
-            if line and len(line) >= 3:
-                # Format: "XY filename" or "XY orig -> renamed"
-                # XY = two-letter status (e.g., " M", "??", "A ", "R ")
-                # Position 0-1: XY status, Position 2: space, Position 3+: filename
-                status_code = line[:2]
-                file_path = line[3:].strip()
-                # Handle renames: "orig -> new"
-                if ' -> ' in file_path:
-                    file_path = file_path.split(' -> ')[1]
-                if file_path:
-                    if status_code == '??':
-                        untracked_files.add(file_path)
-                    else:
-                        modified_files.add(file_path)
+        # Entries are matched in one MULTILINE scan rather than by splitting
+        # the output into lines; lines shorter than 3 characters never match
+        for match in PORCELAIN_ENTRY_PATTERN.finditer(result.stdout):
+            # Format: "XY filename" or "XY orig -> renamed"
+            # XY = two-letter status (e.g., " M", "??", "A ", "R ")
+            # Position 0-1: XY status, Position 2: space, Position 3+: filename
+            status_code, file_path = match.groups()
+            file_path = file_path.strip()
+            # Handle renames: "orig -> new"
+            if ' -> ' in file_path:
+                file_path = file_path.split(' -> ')[1]
+            if file_path:
+                if status_code == '??':
+                    untracked_files.add(file_path)
+                else:
+                    modified_files.add(file_path)
         return modified_files, untracked_files
     except (subprocess.CalledProcessError, FileNotFoundError):
         # Git not available or not a git repo - return empty sets
@@ -174,7 +188,6 @@ def get_committed_req_locations(repo_root: Path) -> Dict[str, str]:
         Dict mapping REQ ID (e.g., 'd00001') to relative file path (e.g., 'spec/dev-app.md')
     """
     req_locations: Dict[str, str] = {}
-    req_pattern = re.compile(r'^#{1,6}\s+REQ-(?:[A-Z]{2,4}-)?([pod]\d{5}):', re.MULTILINE)
 
     try:
         # Get list of spec files in committed state
@@ -186,32 +199,31 @@ def get_committed_req_locations(repo_root: Path) -> Dict[str, str]:
             check=True
         )
 
+        spec_files: List[str] = []
         for file_path in result.stdout.strip().split('\n'):
             if not file_path.endswith('.md'):
                 continue
             if any(skip in file_path for skip in ['INDEX.md', 'README.md', 'requirements-format.md']):
                 continue
-
-            # Get file content from committed state
-            try:
-                content_result = subprocess.run(
-                    ['git', 'show', f'HEAD:{file_path}'],
-                    cwd=repo_root,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                content = content_result.stdout
+            spec_files.append(file_path)
+
+        # Get file contents from committed state concurrently; each read is
+        # a separate git process. Results come back in spec_files order, so
+        # later files still win for duplicate IDs.
+        with ThreadPoolExecutor(max_workers=GIT_SHOW_MAX_WORKERS) as executor:
+            contents = executor.map(
+                lambda file_path: _show_committed_file(repo_root, file_path),
+                spec_files
+            )
+            for file_path, content in zip(spec_files, contents):
+                if content is None:
+                    continue
 
                 # Find all REQ IDs in this file
-                for match in req_pattern.finditer(content):
+                for match in SPEC_REQ_HEADER_PATTERN.finditer(content):
                     req_id = match.group(1)  # Just the ID part (e.g., 'd00001')
                     req_locations[req_id] = file_path
 
-            except subprocess.CalledProcessError:
-                # File might not exist in HEAD (new file)
-                continue
-
     except (subprocess.CalledProcessError, FileNotFoundError):
         # Git not available or not a git repo
         pass
@@ -219,6 +231,30 @@ def get_committed_req_locations(repo_root: Path) -> Dict[str, str]:
     return req_locations
 
 
+def _show_committed_file(repo_root: Path, file_path: str) -> Optional[str]:
+    """Get a file's content from the committed state (HEAD).
+
+    Args:
+        repo_root: Path to repository root
+        file_path: Path of the file relative to the repository root
+
+    Returns:
+        File content, or None if the file does not exist in HEAD
+    """
+    try:
+        result = subprocess.run(
+            ['git', 'show', f'HEAD:{file_path}'],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except subprocess.CalledProcessError:
+        # File might not exist in HEAD (new file)
+        return None
+    return result.stdout
+
+
 class GitState:
     """Singleton for managing git state shared across the application.
 
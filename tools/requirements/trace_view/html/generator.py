@@ -24,7 +24,13 @@ from typing import Dict, List, Optional, Set
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from ..models import Requirement
-from ..coverage import count_by_level, find_orphaned_requirements, calculate_coverage, get_implementation_status
+from ..coverage import (
+    build_children_index,
+    count_by_level,
+    find_orphaned_requirements,
+    calculate_coverage,
+    get_implementation_status,
+)
 
 
 class HTMLGenerator:
@@ -60,6 +66,10 @@ class HTMLGenerator:
         # Instance tracking for flat list building
         self._instance_counter = 0
         self._visited_req_ids: Set[str] = set()
+        # Parent ID -> child requirements, built on first use
+        self._children_index: Optional[Dict[str, List[Requirement]]] = None
+        # Requirement ID -> implementation status, filled in as computed
+        self._status_cache: Dict[str, str] = {}
 
         # Jinja2 template environment
         template_dir = Path(__file__).parent / "templates"
@@ -105,13 +115,27 @@ class HTMLGenerator:
         """Find requirements with missing parents."""
         return find_orphaned_requirements(self.requirements)
 
+    def _get_children_index(self) -> Dict[str, List[Requirement]]:
+        """Get the parent ID -> children index, building it on first use."""
+        if self._children_index is None:
+            self._children_index = build_children_index(self.requirements)
+        return self._children_index
+
+    def _get_child_requirements(self, req_id: str) -> List[Requirement]:
+        """Get the requirements implementing req_id, sorted by ID."""
+        return sorted(self._get_children_index().get(req_id, []), key=lambda r: r.id)
+
     def _calculate_coverage(self, req_id: str) -> dict:
         """Calculate coverage for a requirement."""
-        return calculate_coverage(self.requirements, req_id)
+        return calculate_coverage(
+            self.requirements, req_id, self._get_children_index(), self._status_cache
+        )
 
     def _get_implementation_status(self, req_id: str) -> str:
         """Get implementation status for a requirement."""
-        return get_implementation_status(self.requirements, req_id)
+        return get_implementation_status(
+            self.requirements, req_id, self._get_children_index(), self._status_cache
+        )
 
     def _load_css(self) -> str:
         """Load CSS content from external stylesheet.
@@ -348,8 +372,8 @@ class HTMLGenerator:
                 'level': req.level,
                 'body': req.body.strip(),
                 'rationale': req.rationale.strip(),
-                'file': req.file_path.name,
-                'filePath': f"{self._base_path}{spec_subpath}/{req.file_path.name}",
+                'file': req.file_name,
+                'filePath': f"{self._base_path}{spec_subpath}/{req.file_name}",
                 'line': req.line_number,
                 'implements': list(req.implements) if req.implements else [],
                 'isRoadmap': req.is_roadmap,
@@ -418,11 +442,7 @@ class HTMLGenerator:
         self._instance_counter += 1
 
         # Find child requirements
-        children = [
-            r for r in self.requirements.values()
-            if req.id in r.implements
-        ]
-        children.sort(key=lambda r: r.id)
+        children = self._get_child_requirements(req.id)
 
         # Check if this requirement has children (either child reqs or implementation files)
         has_children = len(children) > 0 or len(req.implementation_files) > 0
@@ -573,7 +593,7 @@ class HTMLGenerator:
         # Display ID without "REQ-" prefix for cleaner tree view
         # Determine the correct spec path (spec/ or spec/roadmap/)
         spec_subpath = 'spec/roadmap' if req.is_roadmap else 'spec'
-        spec_rel_path = f'{spec_subpath}/{req.file_path.name}'
+        spec_rel_path = f'{spec_subpath}/{req.file_name}'
 
         # Display filename without .md extension and without line number
         display_filename = req.file_path.stem  # removes .md extension
@@ -617,7 +637,7 @@ class HTMLGenerator:
             status_title = 'MODIFIED content'
 
         # VS Code link for use in side panel (not in topic column)
-        abs_spec_path = self.repo_root / spec_subpath / req.file_path.name
+        abs_spec_path = self.repo_root / spec_subpath / req.file_name
         vscode_url = f"vscode://file/{abs_spec_path}:{req.line_number}"
 
         # Check if this is a root requirement (no parents)
@@ -654,13 +674,13 @@ class HTMLGenerator:
         if edit_mode:
             if req.is_roadmap:
                 edit_buttons = f'''<span class="edit-actions" onclick="event.stopPropagation();">
-                    <button class="edit-btn from-roadmap" onclick="addPendingMove('{req.id}', '{req.file_path.name}', 'from-roadmap')" title="Move out of roadmap">↩ From Roadmap</button>
-                    <button class="edit-btn move-file" onclick="showMoveToFile('{req.id}', '{req.file_path.name}')" title="Move to different file">📁 Move</button>
+                    <button class="edit-btn from-roadmap" onclick="addPendingMove('{req.id}', '{req.file_name}', 'from-roadmap')" title="Move out of roadmap">↩ From Roadmap</button>
+                    <button class="edit-btn move-file" onclick="showMoveToFile('{req.id}', '{req.file_name}')" title="Move to different file">📁 Move</button>
                 </span>'''
             else:
                 edit_buttons = f'''<span class="edit-actions" onclick="event.stopPropagation();">
-                    <button class="edit-btn to-roadmap" onclick="addPendingMove('{req.id}', '{req.file_path.name}', 'to-roadmap')" title="Move to roadmap">🗺️ To Roadmap</button>
-                    <button class="edit-btn move-file" onclick="showMoveToFile('{req.id}', '{req.file_path.name}')" title="Move to different file">📁 Move</button>
+                    <button class="edit-btn to-roadmap" onclick="addPendingMove('{req.id}', '{req.file_name}', 'to-roadmap')" title="Move to roadmap">🗺️ To Roadmap</button>
+                    <button class="edit-btn move-file" onclick="showMoveToFile('{req.id}', '{req.file_name}')" title="Move to different file">📁 Move</button>
                 </span>'''
         else:
             edit_buttons = ''
@@ -681,7 +701,7 @@ class HTMLGenerator:
 
         # Build HTML for single flat row with unique instance ID
         html = f"""
-        <div class="req-item {level_class} {status_class if req.status == 'Deprecated' else ''} {item_class}" data-req-id="{req.id}" data-instance-id="{instance_id}" data-level="{req.level}" data-indent="{indent}" data-parent-instance-id="{parent_instance_id}" data-topic="{topic}" data-status="{req.status}" data-title="{req.title.lower()}" data-file="{req.file_path.name}" {is_root_attr} {uncommitted_attr} {branch_attr} {has_children_attr} {test_status_attr} {coverage_attr} {roadmap_attr} {conflict_attr} {cycle_attr}>
+        <div class="req-item {level_class} {status_class if req.status == 'Deprecated' else ''} {item_class}" data-req-id="{req.id}" data-instance-id="{instance_id}" data-level="{req.level}" data-indent="{indent}" data-parent-instance-id="{parent_instance_id}" data-topic="{topic}" data-status="{req.status}" data-title="{req.title.lower()}" data-file="{req.file_name}" {is_root_attr} {uncommitted_attr} {branch_attr} {has_children_attr} {test_status_attr} {coverage_attr} {roadmap_attr} {conflict_attr} {cycle_attr}>
             <div class="req-header-container" onclick="toggleRequirement(this)">
                 <span class="collapse-icon">{collapse_icon}</span>
                 <div class="req-content">
@@ -738,16 +758,12 @@ class HTMLGenerator:
             <div class="req-meta">
                 <span class="status-badge status-{status_class}">{req.status}</span>
                 Level: {req.level} |
-                File: {req.file_path.name}:{req.line_number}
+                File: {req.file_name}:{req.line_number}
             </div>
 """
 
         # Find children
-        children = [
-            r for r in self.requirements.values()
-            if req.id in r.implements
-        ]
-        children.sort(key=lambda r: r.id)
+        children = self._get_child_requirements(req.id)
 
         if children:
             # Add current req to path before recursing into children
@@ -819,11 +835,7 @@ class HTMLGenerator:
         level_class = req.level.lower()
 
         # Find children
-        children = [
-            r for r in self.requirements.values()
-            if req.id in r.implements
-        ]
-        children.sort(key=lambda r: r.id)
+        children = self._get_child_requirements(req.id)
 
         # Only show collapse icon if there are children
         collapse_icon = '▼' if children else ''
@@ -858,7 +870,7 @@ class HTMLGenerator:
                         <span class="status-badge status-{status_class}">{req.status}</span>
                     </div>
                     <div class="req-status">{test_badge}</div>
-                    <div class="req-location">{req.file_path.name}:{req.line_number}</div>
+                    <div class="req-location">{req.file_name}:{req.line_number}</div>
                 </div>
             </div>
 """
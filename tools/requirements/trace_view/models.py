@@ -5,11 +5,18 @@ Provides dataclasses for representing requirements and test information.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from .git_state import GitState
 
+# Map elspais level names to the uppercase levels used internally
+ELSPAIS_LEVEL_MAP = {
+    'PRD': 'PRD', 'Ops': 'OPS', 'Dev': 'DEV',
+    'prd': 'PRD', 'ops': 'OPS', 'dev': 'DEV'
+}
+
 
 @dataclass
 class TestInfo:
@@ -73,15 +80,25 @@ class Requirement:
     is_cycle: bool = False
     cycle_path: str = ''
 
-    def _get_spec_relative_path(self) -> str:
-        """Get the spec-relative path for this requirement's file."""
+    @cached_property
+    def file_name(self) -> str:
+        """Name of this requirement's source file (file_path.name, computed once)."""
+        return self.file_path.name
+
+    @cached_property
+    def _spec_relative_path(self) -> str:
+        """Spec-relative path for this requirement's file.
+
+        Cached on first access: the git status properties below all look it
+        up, often several times per requirement while rendering.
+        """
         if self.is_roadmap:
-            return f"spec/roadmap/{self.file_path.name}"
-        return f"spec/{self.file_path.name}"
+            return f"spec/roadmap/{self.file_name}"
+        return f"spec/{self.file_name}"
 
     def _is_in_untracked_file(self) -> bool:
         """Check if requirement is in an untracked (new) file."""
-        rel_path = self._get_spec_relative_path()
+        rel_path = self._spec_relative_path
         return rel_path in GitState.get_untracked()
 
     def _check_modified_in_fileset(self, file_set) -> bool:
@@ -90,7 +107,7 @@ class Requirement:
         For untracked files, all REQs are considered new.
         For modified files, requirement is considered changed if file is in the set.
         """
-        rel_path = self._get_spec_relative_path()
+        rel_path = self._spec_relative_path
 
         # Check if file is untracked (new) - all REQs in new files are new
         if rel_path in GitState.get_untracked():
@@ -129,7 +146,7 @@ class Requirement:
         - It exists in the committed state in a different file, OR
         - It's in a new file but has a non-TBD hash (suggesting it was copied/moved)
         """
-        current_path = self._get_spec_relative_path()
+        current_path = self._spec_relative_path
         committed_path = GitState.get_committed_locations().get(self.id)
 
         if committed_path is not None:
@@ -159,11 +176,6 @@ class Requirement:
         Returns:
             Requirement instance
         """
-        # Map level to uppercase for consistency
-        level_map = {
-            'PRD': 'PRD', 'Ops': 'OPS', 'Dev': 'DEV',
-            'prd': 'PRD', 'ops': 'OPS', 'dev': 'DEV'
-        }
         level = data.get('level', '')
         is_roadmap = data.get('subdir', '') == 'roadmap'
 
@@ -184,7 +196,7 @@ class Requirement:
         req = cls(
             id=req_id.replace('REQ-', ''),  # Strip REQ- prefix for internal use
             title=data.get('title', ''),
-            level=level_map.get(level, level.upper()),
+            level=ELSPAIS_LEVEL_MAP.get(level, level.upper()),
             implements=data.get('implements', []),
             status=data.get('status', 'Active'),
             file_path=Path(data.get('filePath', '')),
@@ -28,6 +28,9 @@ from typing import List, Optional, Tuple
 
 REVIEW_BRANCH_PREFIX = 'reviews/'
 
+# Characters not allowed in sanitized branch name parts
+BRANCH_NAME_INVALID_PATTERN = re.compile(r'[^a-zA-Z0-9_-]')
+
 
 # =============================================================================
 # Branch Naming (REQ-tv-d00013-A, B)
@@ -69,7 +72,7 @@ def _sanitize_branch_name(name: str) -> str:
     # Replace spaces with hyphens
     name = name.replace(' ', '-')
     # Remove invalid characters (keep alphanumeric, hyphen, underscore)
-    name = re.sub(r'[^a-zA-Z0-9_-]', '', name)
+    name = BRANCH_NAME_INVALID_PATTERN.sub('', name)
     # Remove leading/trailing hyphens
     name = name.strip('-')
     # Convert to lowercase
@@ -55,6 +55,13 @@ class ApprovalDecision(str, Enum):
 # Valid REQ status values
 VALID_REQ_STATUSES = {"Draft", "Active", "Deprecated"}
 
+# Requirement ID without REQ- prefix: d00001 or CAL-d00001
+# Negative lookahead to reject REQ- prefix; only sponsor prefixes allowed
+REQ_ID_PATTERN = re.compile(r'^(?!REQ-)(?:[A-Z]{2,4}-)?[pod]\d{5}$')
+
+# 8-character hex content hash
+HASH_PATTERN = re.compile(r'^[a-fA-F0-9]{8}$')
+
 # Default approval rules for status transitions
 DEFAULT_APPROVAL_RULES: Dict[str, List[str]] = {
     "Draft->Active": ["product_owner", "tech_lead"],
@@ -101,16 +108,14 @@ def validate_req_id(req_id: str) -> bool:
     """
     if not req_id:
         return False
-    # Negative lookahead to reject REQ- prefix; only sponsor prefixes allowed
-    pattern = r'^(?!REQ-)(?:[A-Z]{2,4}-)?[pod]\d{5}$'
-    return bool(re.match(pattern, req_id))
+    return bool(REQ_ID_PATTERN.match(req_id))
 
 
 def validate_hash(hash_value: str) -> bool:
     """Validate 8-character hex hash format"""
     if not hash_value:
         return False
-    return bool(re.match(r'^[a-fA-F0-9]{8}$', hash_value))
+    return bool(HASH_PATTERN.match(hash_value))
 
 
 # =============================================================================
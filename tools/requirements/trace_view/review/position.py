@@ -218,18 +218,18 @@ def find_line_in_text(text: str, line_number: int) -> Optional[Tuple[int, int]]:
     if not text or line_number < 1:
         return None
 
-    lines = text.split('\n')
-
-    if line_number > len(lines):
-        return None
-
-    # Calculate start offset by summing lengths of previous lines + newlines
+    # Skip past the preceding newlines without building a list of lines
     start_offset = 0
-    for i in range(line_number - 1):
-        start_offset += len(lines[i]) + 1  # +1 for newline
+    for _ in range(line_number - 1):
+        newline_index = text.find('\n', start_offset)
+        if newline_index == -1:
+            return None
+        start_offset = newline_index + 1
 
-    # End offset is start + length of this line
-    end_offset = start_offset + len(lines[line_number - 1])
+    # End offset is the next newline, or EOF for the last line
+    end_offset = text.find('\n', start_offset)
+    if end_offset == -1:
+        end_offset = len(text)
 
     return (start_offset, end_offset)
 
@@ -312,7 +312,7 @@ def get_line_number_from_char_offset(text: str, char_offset: int) -> int:
     char_offset = min(char_offset, len(text) - 1)
 
     # Count newlines before offset
-    newline_count = text[:char_offset + 1].count('\n')
+    newline_count = text.count('\n', 0, char_offset + 1)
 
     # Special case: if offset is exactly on a newline, it belongs to previous line
     if char_offset < len(text) and text[char_offset] == '\n':
@@ -15,8 +15,9 @@ import os
 import re
 import tempfile
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 # =============================================================================
 # Constants
@@ -28,9 +29,9 @@ VALID_STATUSES = {"Draft", "Active", "Deprecated"}
 # Regex pattern to match the status line in a requirement
 # Matches: **Level**: Dev | **Status**: Draft | **Implements**: REQ-xxx
 STATUS_LINE_PATTERN = re.compile(
-    r'^(\*\*Level\*\*:\s+(?:PRD|Ops|Dev)\s+\|\s+'
-    r'\*\*Status\*\*:\s+)(Draft|Active|Deprecated)'
-    r'(\s+\|\s+\*\*Implements\*\*:\s+[^\n]*?)$',
+    r'^(?P<prefix>\*\*Level\*\*:\s+(?:PRD|Ops|Dev)\s+\|\s+'
+    r'\*\*Status\*\*:\s+)(?P<status>Draft|Active|Deprecated)'
+    r'(?P<suffix>\s+\|\s+\*\*Implements\*\*:\s+[^\n]*?)$',
     re.MULTILINE
 )
 
@@ -66,20 +67,47 @@ class ReqLocation:
 # REQ-tv-d00015-F: Content hash computation and update
 # =============================================================================
 
-def compute_req_hash(content: str) -> str:
+def compute_req_hash(content: Union[str, bytes]) -> str:
     """
     Compute an 8-character hex hash of requirement content.
 
     REQ-tv-d00015-F: The status modifier SHALL update the requirement's
     content hash footer after status changes.
 
+    Uses hashlib's SHA-256, which runs in C (with SHA-NI where the CPU has
+    it). The algorithm and 8-character prefix must match the hashes elspais
+    writes to spec files, so a faster digest such as BLAKE2 is not an option.
+
     Args:
-        content: The content to hash
+        content: The content to hash, as text or as UTF-8 encoded bytes.
+                 Bytes are hashed as-is without another encode copy.
 
     Returns:
         8-character lowercase hex string
     """
-    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:8]
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.sha256(content).hexdigest()[:8]
+
+
+@lru_cache(maxsize=1024)
+def _req_header_pattern(normalized_id: str) -> re.Pattern:
+    """
+    Build the header pattern for one requirement, compiled once per ID.
+
+    Handles both "tv-d00010" and "HHT-d00001" formats; the escaped ID
+    matches the prefix and base ID literally either way.
+
+    Args:
+        normalized_id: The requirement ID without REQ- prefix
+
+    Returns:
+        Compiled pattern whose group 1 is the requirement title
+    """
+    return re.compile(
+        rf'^#{{1,6}}\s+REQ-{re.escape(normalized_id)}:\s+(.+)$',
+        re.MULTILINE
+    )
 
 
 def _extract_req_content(file_content: str, req_id: str) -> Optional[Tuple[str, int, int]]:
@@ -94,23 +122,7 @@ def _extract_req_content(file_content: str, req_id: str) -> Optional[Tuple[str,
     if normalized_id.startswith("REQ-"):
         normalized_id = normalized_id[4:]
 
-    # Build pattern for this specific requirement
-    # Handle both "tv-d00010" and "HHT-d00001" formats
-    if '-' in normalized_id:
-        parts = normalized_id.split('-', 1)
-        prefix = parts[0]
-        base_id = parts[1]
-        header_pattern = re.compile(
-            rf'^#{{1,6}}\s+REQ-{re.escape(prefix)}-{re.escape(base_id)}:\s+(.+)$',
-            re.MULTILINE
-        )
-    else:
-        header_pattern = re.compile(
-            rf'^#{{1,6}}\s+REQ-{re.escape(normalized_id)}:\s+(.+)$',
-            re.MULTILINE
-        )
-
-    header_match = header_pattern.search(file_content)
+    header_match = _req_header_pattern(normalized_id).search(file_content)
     if not header_match:
         return None
 
@@ -185,6 +197,38 @@ def update_req_hash(file_path: Path, req_id: str) -> bool:
 # REQ-tv-d00015-A: find_req_in_file() SHALL locate a requirement
 # =============================================================================
 
+def _find_status_line_after_header(content: str, header_match: re.Match) -> Optional[re.Match]:
+    """
+    Find the status line following a requirement header.
+
+    Lines after the header are stepped through one at a time, testing each
+    against both the status line and the REQ header patterns. Reaching
+    another REQ header first means this requirement has no status line, so
+    the status line returned always belongs to this requirement.
+
+    Args:
+        content: Spec file content
+        header_match: Match of the requirement's header line
+
+    Returns:
+        STATUS_LINE_PATTERN match with 'prefix', 'status' and 'suffix'
+        groups, or None if another REQ header or the end of the file
+        comes first
+    """
+    # header_match ends at the end of the header line
+    newline = content.find('\n', header_match.end())
+    while newline != -1:
+        line_start = newline + 1
+        status_match = STATUS_LINE_PATTERN.match(content, line_start)
+        if status_match:
+            return status_match
+        if REQ_HEADER_PATTERN.match(content, line_start):
+            return None
+        newline = content.find('\n', line_start)
+
+    return None
+
+
 def find_req_in_file(file_path: Path, req_id: str) -> Optional[ReqLocation]:
     """
     Find a requirement in a spec file and return its position info.
@@ -210,43 +254,24 @@ def find_req_in_file(file_path: Path, req_id: str) -> Optional[ReqLocation]:
     if normalized_id.startswith("REQ-"):
         normalized_id = normalized_id[4:]
 
-    # Build pattern for this specific requirement
-    # Handle both "tv-d00010" and "HHT-d00001" formats
-    if '-' in normalized_id:
-        parts = normalized_id.split('-', 1)
-        prefix = parts[0]
-        base_id = parts[1]
-        header_pattern = re.compile(
-            rf'^#{{1,6}}\s+REQ-{re.escape(prefix)}-{re.escape(base_id)}:\s+.+$',
-            re.MULTILINE
-        )
-    else:
-        header_pattern = re.compile(
-            rf'^#{{1,6}}\s+REQ-{re.escape(normalized_id)}:\s+.+$',
-            re.MULTILINE
-        )
-
-    header_match = header_pattern.search(content)
-    if not header_match:
+    # find_req_in_spec_dir tries every spec file; most do not mention this
+    # requirement at all, and a substring probe rejects them cheaply
+    if f"REQ-{normalized_id}:" not in content:
         return None
 
-    # Find the status line after this header
-    # Search from after the header to the next REQ or end of file
-    search_start = header_match.end()
-
-    # Find the next REQ header to limit our search
-    next_req_match = REQ_HEADER_PATTERN.search(content, search_start)
-    search_end = next_req_match.start() if next_req_match else len(content)
+    header_match = _req_header_pattern(normalized_id).search(content)
+    if not header_match:
+        return None
 
-    # Search for the status line within this range
-    status_match = STATUS_LINE_PATTERN.search(content, search_start, search_end)
+    # Step through the lines after the header to its status line
+    status_match = _find_status_line_after_header(content, header_match)
     if not status_match:
         return None
 
-    current_status = status_match.group(2)
+    current_status = status_match.group('status')
 
     # Calculate 1-based line number
-    line_number = content[:status_match.start()].count('\n') + 1
+    line_number = content.count('\n', 0, status_match.start()) + 1
 
     return ReqLocation(
         file_path=file_path,
@@ -419,36 +444,17 @@ def change_req_status(
     if normalized_id.startswith("REQ-"):
         normalized_id = normalized_id[4:]
 
-    # Build pattern for this specific requirement header
-    if '-' in normalized_id:
-        parts = normalized_id.split('-', 1)
-        prefix = parts[0]
-        base_id = parts[1]
-        header_pattern = re.compile(
-            rf'^#{{1,6}}\s+REQ-{re.escape(prefix)}-{re.escape(base_id)}:\s+.+$',
-            re.MULTILINE
-        )
-    else:
-        header_pattern = re.compile(
-            rf'^#{{1,6}}\s+REQ-{re.escape(normalized_id)}:\s+.+$',
-            re.MULTILINE
-        )
-
-    header_match = header_pattern.search(content)
+    header_match = _req_header_pattern(normalized_id).search(content)
     if not header_match:
         return (False, f"REQ-{req_id} header not found in {location.file_path}")
 
     # Find the status line
-    search_start = header_match.end()
-    next_req_match = REQ_HEADER_PATTERN.search(content, search_start)
-    search_end = next_req_match.start() if next_req_match else len(content)
-
-    status_match = STATUS_LINE_PATTERN.search(content, search_start, search_end)
+    status_match = _find_status_line_after_header(content, header_match)
     if not status_match:
         return (False, f"Status line not found for REQ-{req_id}")
 
     # Build the new status line (REQ-tv-d00015-E: preserve formatting)
-    new_line = status_match.group(1) + new_status + status_match.group(3)
+    new_line = status_match.group('prefix') + new_status + status_match.group('suffix')
 
     # Replace the status line in content
     new_content = (
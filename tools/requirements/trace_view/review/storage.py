@@ -35,6 +35,9 @@ from .models import (
     parse_iso_datetime,
 )
 
+# Characters in requirement IDs that are not safe in file paths
+UNSAFE_PATH_CHARS_PATTERN = re.compile(r'[:/]')
+
 
 # =============================================================================
 # Helper Functions
@@ -109,7 +112,7 @@ def normalize_req_id(req_id: str) -> str:
     Returns:
         Normalized requirement ID safe for file paths
     """
-    return re.sub(r'[:/]', '_', req_id)
+    return UNSAFE_PATH_CHARS_PATTERN.sub('_', req_id)
 
 
 def get_reviews_root(repo_root: Path) -> Path:
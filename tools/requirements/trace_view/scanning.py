@@ -5,12 +5,30 @@ Provides functions to scan implementation files for requirement references
 and associate them with requirements.
 """
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Dict, Iterator, List, Set, Optional, Tuple
 
 from .models import Requirement
 
+# Pattern to match requirement references in code comments
+# Matches: REQ-p00001, REQ-o00042, REQ-d00156, REQ-CAL-d00001
+# Bytes pattern: files are scanned without decoding their content
+REQ_REF_PATTERN = re.compile(rb'REQ-(?:([A-Z]+)-)?([pod]\d{5})')
+
+# File suffixes scanned in each kind of implementation directory
+DATABASE_SUFFIXES = frozenset({'.sql'})
+APP_SUFFIXES = frozenset({'.dart'})
+DEFAULT_SUFFIXES = frozenset({'.dart', '.sql', '.py', '.js', '.ts'})
+
+# Directories never walked: VCS metadata, dependencies and build caches
+PRUNED_DIR_NAMES = frozenset({'.git', 'node_modules', '.dart_tool', '__pycache__'})
+
+# Files are read and matched concurrently; the work is mostly I/O
+SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 def scan_implementation_files(
     requirements: Dict[str, Requirement],
@@ -31,12 +49,11 @@ def scan_implementation_files(
         mode: Scanning mode ('core', 'sponsor', 'combined')
         sponsor: Sponsor name for sponsor mode
     """
-    # Pattern to match requirement references in code comments
-    # Matches: REQ-p00001, REQ-o00042, REQ-d00156, REQ-CAL-d00001
-    req_ref_pattern = re.compile(r'REQ-(?:([A-Z]+)-)?([pod]\d{5})')
-
-    total_files_scanned = 0
-    total_refs_found = 0
+    # Collect files first so they can be scanned concurrently. Overlapping
+    # implementation directories (e.g. 'tools' and 'tools/lib') would
+    # otherwise yield the same file more than once.
+    files_to_scan: List[Path] = []
+    seen_files: Set[Path] = set()
 
     for impl_dir in impl_dirs:
         if not impl_dir.exists():
@@ -48,82 +65,186 @@ def scan_implementation_files(
             print(f"   ⏭️  Skipping directory (mode={mode}): {impl_dir}")
             continue
 
-        # Determine file patterns based on directory
-        if impl_dir.name == 'database':
-            patterns = ['*.sql']
-        elif impl_dir.name in ['diary_app', 'portal_app']:
-            patterns = ['**/*.dart']
-        else:
-            # Default: scan common code file types
-            patterns = ['**/*.dart', '**/*.sql', '**/*.py', '**/*.js', '**/*.ts']
-
-        for pattern in patterns:
-            for file_path in impl_dir.glob(pattern):
-                if file_path.is_file():
-                    # Skip files in sponsor directories if not in the right mode
-                    if _should_skip_file(file_path, mode, sponsor):
-                        continue
-
-                    total_files_scanned += 1
-                    refs = _scan_file_for_requirements(
-                        file_path, req_ref_pattern, requirements, repo_root
-                    )
-                    total_refs_found += len(refs)
+        for file_path in _iter_impl_files(impl_dir):
+            # Skip files in sponsor directories if not in the right mode
+            if _should_skip_file(file_path, mode, sponsor):
+                continue
+            if file_path in seen_files:
+                continue
+            seen_files.add(file_path)
+            files_to_scan.append(file_path)
+
+    total_files_scanned = len(files_to_scan)
+    total_refs_found = 0
+
+    # Entries already recorded per requirement, for O(1) duplicate checks
+    seen_entries: Dict[str, Set[Tuple[str, int]]] = {}
+
+    # Workers only read; requirements are updated here, in file order
+    with ThreadPoolExecutor(max_workers=SCAN_MAX_WORKERS) as executor:
+        results = executor.map(
+            lambda path: _scan_file_for_requirements(path, REQ_REF_PATTERN, requirements),
+            files_to_scan
+        )
+        for file_path, (referenced_reqs, found_refs) in zip(files_to_scan, results):
+            total_refs_found += len(referenced_reqs)
+            if found_refs:
+                _add_implementation_refs(
+                    file_path, found_refs, requirements, repo_root, seen_entries
+                )
 
     print(f"   ✅ Scanned {total_files_scanned} implementation files")
     print(f"   📌 Found {total_refs_found} requirement references")
 
 
+def _iter_impl_files(impl_dir: Path) -> Iterator[Path]:
+    """Yield the implementation files to scan in a directory.
+
+    The directory tree is walked once and filtered by suffix, rather than
+    globbing it once per file type.
+
+    Args:
+        impl_dir: Implementation directory to walk
+
+    Yields:
+        Paths of files to scan
+    """
+    # Determine file types based on directory
+    if impl_dir.name == 'database':
+        return _walk_files(str(impl_dir), DATABASE_SUFFIXES, recursive=False)
+    elif impl_dir.name in ['diary_app', 'portal_app']:
+        return _walk_files(str(impl_dir), APP_SUFFIXES, recursive=True)
+    else:
+        # Default: scan common code file types
+        return _walk_files(str(impl_dir), DEFAULT_SUFFIXES, recursive=True)
+
+
+def _walk_files(directory: str, suffixes: frozenset, recursive: bool) -> Iterator[Path]:
+    """Yield files under a directory whose suffix is in suffixes.
+
+    Uses os.scandir so directory entries carry their type from the listing,
+    and only builds a Path for files that match. Entries are taken in name
+    order so the result does not depend on the filesystem. Files in a
+    directory are yielded before its subdirectories are walked; symlinked
+    directories are not followed, as with Path.rglob, and PRUNED_DIR_NAMES
+    are skipped.
+
+    Args:
+        directory: Directory to list
+        suffixes: File suffixes to yield (e.g. '.py')
+        recursive: Whether to walk subdirectories
+
+    Yields:
+        Paths of matching files
+    """
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and entry.name not in PRUNED_DIR_NAMES:
+                        subdirs.append(entry.path)
+                elif os.path.splitext(entry.name)[1] in suffixes and entry.is_file():
+                    yield Path(entry.path)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return
+
+    for subdir in subdirs:
+        yield from _walk_files(subdir, suffixes, recursive)
+
+
 def _scan_file_for_requirements(
     file_path: Path,
     pattern: re.Pattern,
-    requirements: Dict[str, Requirement],
-    repo_root: Path
-) -> Set[str]:
+    requirements: Dict[str, Requirement]
+) -> Tuple[Set[str], List[Tuple[str, int]]]:
     """Scan a single implementation file for requirement references.
 
+    Does not modify requirements, so it is safe to call from worker threads.
+
     Args:
         file_path: Path to the file to scan
-        pattern: Compiled regex pattern for matching REQ references
+        pattern: Compiled bytes pattern for matching REQ references
         requirements: Dict mapping requirement ID to Requirement
-        repo_root: Repository root for calculating relative paths
 
     Returns:
-        Set of requirement IDs found in the file
+        Tuple of (referenced_reqs, found_refs):
+        - referenced_reqs: Set of requirement IDs found in the file
+        - found_refs: (req_id, line_number) for each reference to a known requirement
     """
     try:
-        content = file_path.read_text(encoding='utf-8')
-    except (UnicodeDecodeError, PermissionError):
+        # References are ASCII, so only the matched IDs need decoding
+        content = file_path.read_bytes()
+    except PermissionError:
         # Skip files that can't be read
-        return set()
+        return set(), []
+
+    # Most files reference no requirements; a substring probe is far
+    # cheaper than running the regex over the whole file
+    if b'REQ-' not in content:
+        return set(), []
 
     # Find all requirement IDs referenced in this file with their line numbers
     referenced_reqs: Set[str] = set()
-    rel_path = file_path.relative_to(repo_root)  # Relative to repo root
+    found_refs: List[Tuple[str, int]] = []
 
-    for match in pattern.finditer(content):
-        sponsor_prefix = match.group(1)  # May be None for core requirements
-        req_id_core = match.group(2)  # The core part (e.g., 'd00027')
+    # Matches arrive in file order, so newlines are counted incrementally
+    # from the previous counted match instead of from the start of the file
+    line_num = 1
+    counted_to = 0
 
-        # Build full requirement ID (with sponsor prefix if present)
-        if sponsor_prefix:
-            req_id = f"{sponsor_prefix}-{req_id_core}"
-        else:
-            req_id = req_id_core
+    for match in pattern.finditer(content):
+        # The match is 'REQ-' followed by the full ID (with sponsor prefix if
+        # present), so the ID is a slice of it; no need to rebuild it from
+        # its groups
+        req_id = match.group()[4:].decode('ascii')
 
         referenced_reqs.add(req_id)
 
+        # Only references to known requirements need a line number
+        if req_id not in requirements:
+            continue
+
         # Calculate line number from match position
-        line_num = content[:match.start()].count('\n') + 1
+        start = match.start()
+        line_num += content.count(b'\n', counted_to, start)
+        counted_to = start
+        found_refs.append((req_id, line_num))
 
-        # Add (file_path, line_number) tuple to requirement's implementation_files
-        if req_id in requirements:
-            impl_entry = (str(rel_path), line_num)
-            # Avoid duplicates (same file, same line)
-            if impl_entry not in requirements[req_id].implementation_files:
-                requirements[req_id].implementation_files.append(impl_entry)
+    return referenced_reqs, found_refs
 
-    return referenced_reqs
+
+def _add_implementation_refs(
+    file_path: Path,
+    found_refs: List[Tuple[str, int]],
+    requirements: Dict[str, Requirement],
+    repo_root: Path,
+    seen_entries: Dict[str, Set[Tuple[str, int]]]
+) -> None:
+    """Add a file's references to each requirement's implementation_files.
+
+    Args:
+        file_path: Path to the scanned file
+        found_refs: (req_id, line_number) pairs from _scan_file_for_requirements
+        requirements: Dict mapping requirement ID to Requirement
+        repo_root: Repository root for calculating relative paths
+        seen_entries: Per-requirement sets mirroring implementation_files,
+                      shared across one scan and filled in here
+    """
+    rel_path = str(file_path.relative_to(repo_root))  # Relative to repo root
+
+    for req_id, line_num in found_refs:
+        # Add (file_path, line_number) tuple to requirement's implementation_files
+        impl_entry = (rel_path, line_num)
+        implementation_files = requirements[req_id].implementation_files
+        seen = seen_entries.get(req_id)
+        if seen is None:
+            # Include entries from earlier scans of this requirement
+            seen = seen_entries[req_id] = set(implementation_files)
+        # Avoid duplicates (same file, same line)
+        if impl_entry not in seen:
+            seen.add(impl_entry)
+            implementation_files.append(impl_entry)
 
 
 def _should_skip_directory(dir_path: Path, mode: str, sponsor: Optional[str]) -> bool:
@@ -248,6 +248,26 @@ class TestFindReqInFile:
         assert result2 is not None
         assert result1.current_status == result2.current_status
 
+    def test_find_req_in_file_ignores_next_requirement_status(self, tmp_path):
+        """REQ-tv-d00015-A: Does not use the status line of a following requirement"""
+        m = import_status_module()
+        find_req_in_file = m['find_req_in_file']
+
+        spec_file = tmp_path / "dev-test.md"
+        spec_file.write_text("""# REQ-tv-d00001: Missing Status
+
+No status line here.
+
+# REQ-tv-d00002: Has Status
+
+**Level**: Dev | **Status**: Active | **Implements**: REQ-tv-p00001
+""")
+
+        assert find_req_in_file(spec_file, "tv-d00001") is None
+        result = find_req_in_file(spec_file, "tv-d00002")
+        assert result is not None
+        assert result.line_number == 7
+
 
 # =============================================================================
 # Assertion B: get_req_status() SHALL read and return current status
@@ -549,6 +569,25 @@ class TestHashUpdate:
 
         assert hash1 != hash2
 
+    def test_compute_req_hash_matches_sha256_prefix(self):
+        """REQ-tv-d00015-F: Hash is the SHA-256 prefix of the UTF-8 content"""
+        m = import_status_module()
+        compute_req_hash = m['compute_req_hash']
+
+        content = "Body with non-ASCII text: Größe"
+        expected = hashlib.sha256(content.encode('utf-8')).hexdigest()[:8]
+
+        assert compute_req_hash(content) == expected
+
+    def test_compute_req_hash_accepts_bytes(self):
+        """REQ-tv-d00015-F: UTF-8 bytes hash the same as the equivalent text"""
+        m = import_status_module()
+        compute_req_hash = m['compute_req_hash']
+
+        content = "Body with non-ASCII text: Größe"
+
+        assert compute_req_hash(content.encode('utf-8')) == compute_req_hash(content)
+
     def test_change_req_status_updates_hash(self, sample_repo_root):
         """REQ-tv-d00015-F: Hash is updated after status change"""
         m = import_status_module()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Tests for implementation file scanning.
+
+Covers scan_implementation_files(): which files are scanned and how
+requirement references are attached to requirements.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from trace_view.models import Requirement
+from trace_view.scanning import scan_implementation_files
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+def make_requirement(req_id: str) -> Requirement:
+    """Create a minimal requirement for scanning tests."""
+    return Requirement(
+        id=req_id,
+        title=f"Requirement {req_id}",
+        level='DEV',
+        implements=[],
+        status='Active',
+        file_path=Path('spec/dev-test.md'),
+        line_number=1
+    )
+
+
+@pytest.fixture
+def requirements():
+    """Requirements referenced by the sample repo."""
+    return {
+        req_id: make_requirement(req_id)
+        for req_id in ('d00001', 'd00002', 'CAL-d00003')
+    }
+
+
+@pytest.fixture
+def sample_repo(tmp_path):
+    """Create a repo with database and tools implementation directories."""
+    (tmp_path / 'database').mkdir()
+    (tmp_path / 'database' / 'schema.sql').write_text(
+        "-- IMPLEMENTS REQUIREMENTS:\n"
+        "--   REQ-d00001\n"
+    )
+
+    tools_dir = tmp_path / 'tools' / 'lib'
+    tools_dir.mkdir(parents=True)
+    (tools_dir / 'helper.py').write_text(
+        '"""Helper.\n'
+        '\n'
+        'IMPLEMENTS REQUIREMENTS:\n'
+        '    REQ-d00002: Helper\n'
+        '    REQ-CAL-d00003: Sponsor helper\n'
+        '    REQ-p99999: Unknown requirement\n'
+        '"""\n'
+    )
+    (tools_dir / 'notes.txt').write_text("REQ-d00001\n")
+
+    return tmp_path
+
+
+# =============================================================================
+# Reference detection
+# =============================================================================
+
+class TestScanImplementationFiles:
+    """scan_implementation_files() attaches (file, line) references."""
+
+    def test_records_file_and_line(self, sample_repo, requirements):
+        """References are recorded relative to the repo root with 1-based lines"""
+        scan_implementation_files(
+            requirements,
+            [sample_repo / 'database', sample_repo / 'tools'],
+            sample_repo,
+            mode='combined'
+        )
+
+        assert requirements['d00001'].implementation_files == [('database/schema.sql', 2)]
+        assert requirements['d00002'].implementation_files == [('tools/lib/helper.py', 4)]
+
+    def test_records_sponsor_prefixed_reference(self, sample_repo, requirements):
+        """REQ-CAL-d00003 references resolve to the sponsor requirement"""
+        scan_implementation_files(
+            requirements, [sample_repo / 'tools'], sample_repo, mode='combined'
+        )
+
+        assert requirements['CAL-d00003'].implementation_files == [('tools/lib/helper.py', 5)]
+
+    def test_ignores_unscanned_extensions(self, sample_repo, requirements):
+        """Files without a scanned extension are not read"""
+        scan_implementation_files(
+            requirements, [sample_repo / 'tools'], sample_repo, mode='combined'
+        )
+
+        assert requirements['d00001'].implementation_files == []
+
+    def test_rescan_does_not_duplicate_entries(self, sample_repo, requirements):
+        """Scanning twice keeps a single entry per file and line"""
+        impl_dirs = [sample_repo / 'database']
+
+        scan_implementation_files(requirements, impl_dirs, sample_repo, mode='combined')
+        scan_implementation_files(requirements, impl_dirs, sample_repo, mode='combined')
+
+        assert requirements['d00001'].implementation_files == [('database/schema.sql', 2)]
+
+    def test_overlapping_directories_scan_file_once(self, sample_repo, requirements, capsys):
+        """A file under two listed directories is scanned only once"""
+        scan_implementation_files(
+            requirements,
+            [sample_repo / 'tools', sample_repo / 'tools' / 'lib'],
+            sample_repo,
+            mode='combined'
+        )
+
+        assert "Scanned 1 implementation files" in capsys.readouterr().out
+        assert requirements['d00002'].implementation_files == [('tools/lib/helper.py', 4)]
+
+    def test_dependency_directories_are_pruned(self, tmp_path, requirements):
+        """Files under node_modules and similar directories are not scanned"""
+        vendored = tmp_path / 'tools' / 'node_modules' / 'pkg'
+        vendored.mkdir(parents=True)
+        (vendored / 'index.js').write_text("// REQ-d00001\n")
+
+        scan_implementation_files(
+            requirements, [tmp_path / 'tools'], tmp_path, mode='combined'
+        )
+
+        assert requirements['d00001'].implementation_files == []
+
+    def test_line_numbers_with_multibyte_content(self, tmp_path, requirements):
+        """Non-ASCII text before a reference does not shift its line number"""
+        (tmp_path / 'tools').mkdir()
+        (tmp_path / 'tools' / 'i18n.py').write_text(
+            "# Größe — 日本語\n# REQ-d00001\n", encoding='utf-8'
+        )
+
+        scan_implementation_files(
+            requirements, [tmp_path / 'tools'], tmp_path, mode='combined'
+        )
+
+        assert requirements['d00001'].implementation_files == [('tools/i18n.py', 2)]
+
+    def test_non_utf8_file_is_scanned(self, tmp_path, requirements):
+        """Files that are not valid UTF-8 are still scanned for ASCII references"""
+        (tmp_path / 'tools').mkdir()
+        (tmp_path / 'tools' / 'legacy.py').write_bytes(b"# caf\xe9\n# REQ-d00002\n")
+
+        scan_implementation_files(
+            requirements, [tmp_path / 'tools'], tmp_path, mode='combined'
+        )
+
+        assert requirements['d00002'].implementation_files == [('tools/legacy.py', 2)]
+
+    def test_files_recorded_in_path_order(self, tmp_path, requirements):
+        """References from several files are listed in a deterministic path order"""
+        tools_dir = tmp_path / 'tools'
+        (tools_dir / 'sub').mkdir(parents=True)
+        for name in ('c.py', 'a.ts', 'b.sql', 'sub/a.dart'):
+            (tools_dir / name).write_text("# REQ-d00001\n")
+
+        scan_implementation_files(
+            requirements, [tools_dir], tmp_path, mode='combined'
+        )
+
+        assert requirements['d00001'].implementation_files == [
+            ('tools/a.ts', 1), ('tools/b.sql', 1), ('tools/c.py', 1),
+            ('tools/sub/a.dart', 1)
+        ]
+
+    def test_missing_directory_is_skipped(self, tmp_path, requirements):
+        """A nonexistent implementation directory does not raise"""
+        scan_implementation_files(
+            requirements, [tmp_path / 'missing'], tmp_path, mode='combined'
+        )
+
+        assert all(not r.implementation_files for r in requirements.values())
+
+    def test_line_numbers_for_repeated_references(self, tmp_path, requirements):
+        """Each of several references in one file gets its own line number"""
+        (tmp_path / 'tools').mkdir()
+        (tmp_path / 'tools' / 'multi.py').write_text(
+            "# REQ-d00001\n"
+            "\n"
+            "# REQ-p99999 REQ-d00002\n"
+            "x = 1\n"
+            "# REQ-d00001\n"
+        )
+
+        scan_implementation_files(
+            requirements, [tmp_path / 'tools'], tmp_path, mode='combined'
+        )
+
+        assert requirements['d00001'].implementation_files == [
+            ('tools/multi.py', 1), ('tools/multi.py', 5)
+        ]
+        assert requirements['d00002'].implementation_files == [('tools/multi.py', 3)]
@@ -34,10 +34,13 @@ def run_elspais_validate() -> bool:
                 print(result.stdout)
             return False
 
-        # Print success output (shows requirement count)
-        for line in result.stdout.split('\n'):
-            if line.strip() and not line.strip().startswith('{'):
-                print(f"   {line}")
+        # Print success output (shows requirement count), written in one go
+        # rather than one print per line
+        output_lines = [
+            f"   {line}\n" for line in result.stdout.split('\n')
+            if line.strip() and not line.strip().startswith('{')
+        ]
+        sys.stdout.write(''.join(output_lines))
         return True
     except FileNotFoundError:
         print("⚠️  elspais not found - skipping format validation")